@@ -1,6 +1,7 @@
 @echo off
 REM ZX Answering Assistant 构建脚本
-REM 自动清理缓存并重新编译
+REM 默认增量构建（复用 build\flutter 等 flet 缓存）
+REM 用法: build.bat [--clean]    --clean 清除构建缓存后完整重建
 
 echo ======================================================================
 echo    🚀 ZX Answering Assistant 构建脚本
@@ -21,26 +22,24 @@ echo.
 REM 激活虚拟环境
 call .venv\Scripts\activate.bat
 
-echo 📋 正在清理旧的构建文件...
-if exist "build\windows" (
-    echo   - 删除 build/windows
-    rmdir /s /q "build\windows"
-)
-if exist "build\flutter" (
-    echo   - 删除 build/flutter (模板缓存)
-    rmdir /s /q "build\flutter"
-)
-if exist "dist" (
-    echo   - 删除 dist
-    rmdir /s /q "dist"
+set "FLET_CACHE_ARGS="
+if /i "%~1"=="--clean" (
+    echo 📋 正在清理旧的构建文件...
+    if exist "dist" (
+        echo   - 删除 dist
+        rmdir /s /q "dist"
+    )
+    REM --clear-cache 由 flet 删除 build\flutter 模板缓存
+    set "FLET_CACHE_ARGS=--clear-cache"
+    echo ✓ 清理完成
+) else (
+    echo ♻️  增量构建：复用已有的构建缓存（需要完整重建请使用 build.bat --clean）
 )
-
-echo ✓ 清理完成
 echo.
 
 echo 📦 正在编译应用（详细模式）...
 echo.
-flet build windows --project=ZX-Answering-Assistant --verbose
+flet build windows --project=ZX-Answering-Assistant --verbose %FLET_CACHE_ARGS%
 
 if %ERRORLEVEL% EQU 0 (
     echo.
@@ -23,25 +23,15 @@ except (TypeError, AttributeError):
     if isinstance(__builtins__, dict):
         __builtins__['exit'] = lambda code=0: sys.exit(code)
 
-# 设置控制台编码为 UTF-8（Windows 打包环境必需）
-if sys.platform == 'win32':
-    try:
-        import codecs
-        # 确保 stdout 和 stderr 使用 UTF-8 编码
-        # 先检查是否已经被重新定向
-        if hasattr(sys.stdout, 'buffer') and hasattr(sys.stderr, 'buffer'):
-            sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer)
-            sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer)
-        elif hasattr(sys.stdout, 'reconfigure'):
-            sys.stdout.reconfigure(encoding='utf-8')
-            sys.stderr.reconfigure(encoding='utf-8')
-    except Exception:
-        # 如果上述方法失败，使用环境变量
-        os.environ['PYTHONIOENCODING'] = 'utf-8'
-
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+_PROJECT_ROOT_STR = str(project_root)
+if _PROJECT_ROOT_STR not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT_STR)
+
+# 设置控制台编码为 UTF-8（Windows 打包环境必需）
+from src.utils.console import configure_utf8_console
+configure_utf8_console()
 
 # 【重要】在所有网络操作之前配置 SSL 证书
 # 这必须在导入 Flet 或 Playwright 之前完成
@@ -66,9 +56,6 @@ setup_app_logging()
 # 导入版本信息
 import version
 
-# 显示版本信息
-version.print_version_info()
-
 # 设置Playwright浏览器路径（支持打包后的exe）
 def setup_playwright_browser(silent=False):
     """设置Playwright浏览器路径
@@ -130,23 +117,27 @@ def setup_playwright_browser(silent=False):
                     except:
                         expected_revision = None
 
-                    if expected_revision and chromium_dir.name != f"chromium-{expected_revision}":
+                    correct_dir = browsers_dir / f"chromium-{expected_revision}"
+                    if expected_revision and correct_dir.exists():
+                        # 之前的启动已经建立过兼容目录，直接复用，不再删除重建
+                        log(f"[OK] 已存在版本兼容目录: {correct_dir.name}")
+                    elif expected_revision and chromium_dir.name != correct_dir.name:
                         # 版本号不匹配，创建符号链接或重命名
                         print(f"[INFO] 版本号不匹配: {chromium_dir.name} vs chromium-{expected_revision}")
                         print(f"[INFO] 创建兼容性链接...")
 
-                        correct_dir = browsers_dir / f"chromium-{expected_revision}"
                         try:
-                            # 创建符号链接（需要管理员权限）或重命名
-                            if correct_dir.exists():
-                                shutil.rmtree(correct_dir)
-
-                            # 创建目录符号链接或 junction（Windows）
+                            # 用链接代替拷贝整个浏览器目录：Windows 用 mklink /J 建 junction（无需管理员权限），
+                            # 其它平台建目录符号链接，均不复制任何文件
                             if sys.platform == 'win32':
                                 import subprocess
-                                subprocess.run(['mklink', '/J', str(chromium_dir), str(correct_dir)], check=False, shell=True)
+                                # mklink /J <链接> <目标>
+                                subprocess.run(
+                                    ['cmd', '/c', 'mklink', '/J', str(correct_dir), str(chromium_dir)],
+                                    check=True, capture_output=True,
+                                )
                             else:
-                                shutil.copytree(str(chromium_dir), str(correct_dir))
+                                os.symlink(chromium_dir, correct_dir, target_is_directory=True)
 
                             log(f"[OK] 已创建版本兼容链接: {correct_dir}")
                         except Exception as e:
@@ -157,12 +148,6 @@ def setup_playwright_browser(silent=False):
                             except:
                                 log(f"[WARN] 版本号不匹配，但尝试继续使用: {chromium_dir.name}")
 
-                # 设置Playwright浏览器路径环境变量
-                os.environ['PLAYWRIGHT_BROWSERS_PATH'] = str(browsers_dir)
-                # 同时设置用户数据目录指向临时目录
-                os.environ['PLAYWRIGHT_USER_DATA_DIR'] = str(Path(tempfile.gettempdir()) / "playwright_user_data")
-                log(f"[OK] 使用打包的浏览器")
-
                 # 设置Playwright浏览器路径环境变量
                 os.environ['PLAYWRIGHT_BROWSERS_PATH'] = str(browsers_dir)
                 # 同时设置用户数据目录指向临时目录
@@ -342,10 +327,14 @@ def setup_flet_executable(silent=False):
         log(f"[WARN] 设置Flet可执行文件失败: {e}")
 
 
-# 在导入Playwright和Flet之前设置路径（静默模式）
-# 只有在确定使用 GUI 模式时才会显示详细信息
-setup_playwright_browser(silent=True)
-setup_flet_executable(silent=True)
+def _startup():
+    """启动前的环境准备（仅作为入口运行时执行，import main 不产生副作用）"""
+    # 显示版本信息
+    version.print_version_info()
+
+    # 在导入Playwright和Flet之前设置路径（静默模式）
+    setup_playwright_browser(silent=True)
+    setup_flet_executable(silent=True)
 
 
 def run_gui_mode():
@@ -439,6 +428,8 @@ def show_startup_banner():
 
 
 if __name__ == "__main__":
+    _startup()
+
     # 显示启动横幅
     show_startup_banner()
 
@@ -24,6 +24,7 @@ _EXPORTS = {
     'get_student_access_token_with_credentials': ('src.auth.student', 'get_student_access_token_with_credentials'),
     'get_student_courses': ('src.auth.student', 'get_student_courses'),
     'get_uncompleted_chapters': ('src.auth.student', 'get_uncompleted_chapters'),
+    'fill_uncompleted_chapters': ('src.auth.student', 'fill_uncompleted_chapters'),
     'navigate_to_course': ('src.auth.student', 'navigate_to_course'),
     'close_browser': ('src.auth.student', 'close_browser'),
     'get_course_progress_from_page': ('src.auth.student', 'get_course_progress_from_page'),
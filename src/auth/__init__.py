@@ -13,6 +13,7 @@ from src.auth.student import (
     get_student_access_token_with_credentials,
     get_student_courses,
     get_uncompleted_chapters,
+    fill_uncompleted_chapters,
     navigate_to_course,
     close_browser,
     get_course_progress_from_page,
@@ -28,7 +29,8 @@ __all__ = [
     'TokenManager', 'get_token_manager',
     'teacher_get_access_token',
     'get_student_access_token', 'get_student_access_token_with_credentials',
-    'get_student_courses', 'get_uncompleted_chapters', 'navigate_to_course',
+    'get_student_courses', 'get_uncompleted_chapters', 'fill_uncompleted_chapters',
+    'navigate_to_course',
     'close_browser', 'get_course_progress_from_page', 'get_browser_page',
     'get_cached_access_token', 'set_access_token',
 ]
@@ -3,6 +3,7 @@
 从 src/auth/student.py 抽出。依赖 _student_browser_health 的 ensure_browser_alive/is_browser_alive。
 """
 
+import base64
 import json
 import time
 import logging
@@ -16,6 +17,11 @@ from .token_manager import get_token_manager
 
 logger = logging.getLogger(__name__)
 
+# 无法解析过期时间的 token 只短暂缓存，避免把旧 token 当新 token 用满整个有效期
+_UNKNOWN_EXPIRY_CACHE_SECONDS = 300
+# 按 JWT exp 计算缓存时长时预留的安全余量
+_EXPIRY_SAFETY_MARGIN_SECONDS = 60
+
 
 def _ensure_context_and_page(browser_type: BrowserType = BrowserType.STUDENT) -> Tuple[Optional[BrowserContext], Optional[Page]]:
     """确保学生端上下文和页面存在。"""
@@ -60,10 +66,40 @@ def _get_browser_page_impl() -> Optional[Tuple[Browser, Page]]:
 def get_access_token_from_browser() -> Optional[str]:
     """从已登录的浏览器中提取 access_token（优先使用缓存，未命中再监听浏览器）。"""
     # 快速路径：token_manager 中有未过期的缓存 token，直接返回（跳过10s+的浏览器提取）
-    cached = get_token_manager().get_student_token()
+    token_manager = get_token_manager()
+    cached = token_manager.get_student_token()
     if cached:
         return cached
-    return run_in_thread_if_asyncio(_get_access_token_from_browser_impl)
+    token = run_in_thread_if_asyncio(_get_access_token_from_browser_impl)
+    if token:
+        # 写回缓存：从浏览器取到的 token 签发时间未知，按其真实剩余有效期缓存
+        cache_seconds = _token_cache_seconds(token)
+        if cache_seconds > 0:
+            token_manager.set_student_token(token, expiry_seconds=cache_seconds)
+    return token
+
+
+def _jwt_remaining_seconds(token: str) -> Optional[float]:
+    """解析 JWT payload 中的 exp，返回剩余有效秒数；不是 JWT 或没有 exp 时返回 None。"""
+    parts = token.split('.')
+    if len(parts) != 3:
+        return None
+    try:
+        payload = parts[1] + '=' * (-len(parts[1]) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if not isinstance(exp, (int, float)):
+        return None
+    return exp - time.time()
+
+
+def _token_cache_seconds(token: str) -> int:
+    """计算从浏览器提取的 token 可缓存的秒数（<=0 表示已过期或即将过期，不缓存）。"""
+    remaining = _jwt_remaining_seconds(token)
+    if remaining is None:
+        return _UNKNOWN_EXPIRY_CACHE_SECONDS
+    return int(remaining - _EXPIRY_SAFETY_MARGIN_SECONDS)
 
 
 def _get_access_token_from_browser_impl() -> Optional[str]:
@@ -218,6 +254,8 @@ def _get_course_progress_from_page_impl() -> Optional[Dict]:
         except Exception:
             logger.debug("等待页面加载超时，继续解析页面")
 
+        # 页面上没有可靠的“当前课程已渲染”标志：SPA 切换时 .el-menu-item 可能还是上一门课程的菜单，
+        # wait_for_selector 会立即返回，因此先短暂等待新菜单渲染
         time.sleep(0.5)
 
         try:
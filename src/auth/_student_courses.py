@@ -6,6 +6,7 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 from src.core.api_client import get_api_client
@@ -13,6 +14,10 @@ from src.core.headers import get_api_headers
 
 logger = logging.getLogger(__name__)
 
+# 并发获取各课程未完成知识点时的线程数。请求间隔仍由 APIClient 的全局限速控制，
+# 并发只是让上一个请求的网络往返与下一个请求的限速等待重叠
+_UNCOMPLETED_FETCH_WORKERS = 4
+
 
 def get_uncompleted_chapters(
     access_token: str, course_id: str, delay_ms: int = 600, max_retries: int = 3
@@ -103,6 +108,40 @@ def get_uncompleted_chapters(
         return None
 
 
+def fill_uncompleted_chapters(
+    access_token: str, courses: List[Dict], max_retries: int = 3
+) -> List[Dict]:
+    """并发获取每门课程的未完成知识点，写入 course['uncompleted_knowledges']。
+
+    Args:
+        access_token: 学生端的 access_token。
+        courses: 课程列表（原地更新）。
+        max_retries: 每门课程的最大重试次数。
+
+    Returns:
+        传入的课程列表；获取失败的课程记为空列表。
+    """
+    def fetch(course: Dict) -> None:
+        try:
+            uncompleted = get_uncompleted_chapters(
+                access_token, course['courseID'], delay_ms=0, max_retries=max_retries
+            )
+        except Exception as e:
+            logger.error(f"  ❌ 获取课程 {course.get('courseName')} 未完成知识点失败: {e}")
+            uncompleted = None
+        course['uncompleted_knowledges'] = uncompleted or []
+        logger.info(f"  ✅ {course.get('courseName')}: {len(course['uncompleted_knowledges'])} 个未完成知识点")
+
+    pending = [course for course in courses if course.get('courseID')]
+    if pending:
+        with ThreadPoolExecutor(
+            max_workers=min(_UNCOMPLETED_FETCH_WORKERS, len(pending)),
+            thread_name_prefix="uncompleted-chapters",
+        ) as executor:
+            list(executor.map(fetch, pending))
+    return courses
+
+
 def _get_student_courses_request(
     access_token: str, max_retries: Optional[int] = None
 ) -> Optional[List[Dict]]:
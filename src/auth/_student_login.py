@@ -11,6 +11,7 @@ from typing import Optional
 from src.core.browser import get_browser_manager, BrowserType, run_in_thread_if_asyncio
 from ._student_browser_health import cleanup_browser
 from src.auth.token_manager import get_token_manager
+from src.utils.text import is_yes
 
 logger = logging.getLogger(__name__)
 _token_manager = get_token_manager()
@@ -45,7 +46,7 @@ def _get_student_access_token_impl(
                     print("\n💡 检测到已保存的学生端账号")
                     use_saved = input("是否使用已保存的账号？(yes/no，默认yes): ").strip().lower()
 
-                    if use_saved in ['', 'yes', 'y', '是']:
+                    if is_yes(use_saved, default=True):
                         print(f"✅ 使用已保存的账号: {config_username[:3]}****")
                         username = config_username
                         password = config_password
@@ -229,7 +230,7 @@ def get_student_access_token_with_credentials() -> Optional[str]:
             print("\n💡 检测到已保存的学生端账号")
             use_saved = input("是否使用已保存的账号？(yes/no，默认yes): ").strip().lower()
 
-            if use_saved in ['', 'yes', 'y', '是']:
+            if is_yes(use_saved, default=True):
                 print(f"✅ 使用已保存的账号: {config_username[:3]}****")
                 return get_student_access_token(config_username, config_password)
             else:
@@ -34,7 +34,11 @@ from ._student_browser_health import (
     ensure_browser_alive,
     is_browser_alive,
 )
-from ._student_courses import get_student_courses, get_uncompleted_chapters
+from ._student_courses import (
+    fill_uncompleted_chapters,
+    get_student_courses,
+    get_uncompleted_chapters,
+)
 from ._student_browser_ops import (
     get_access_token_from_browser,
     get_browser_page,
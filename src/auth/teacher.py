@@ -19,6 +19,8 @@ from src.core.browser import (
     BrowserType,
     run_in_thread_if_asyncio
 )
+from src.auth.token_manager import get_token_manager
+from src.utils.text import is_yes
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -32,8 +34,24 @@ def get_access_token() -> Optional[str]:
     Returns:
         Optional[str]: 获取到的access_token，如果失败则返回None
     """
+    # 快速路径：token_manager 中有未过期的教师端 token，直接返回（跳过浏览器登录）
+    token_manager = get_token_manager()
+    cached = token_manager.get_teacher_token()
+    if cached:
+        logger.info("✅ 使用缓存的教师端access_token")
+        return cached
+
     # 使用浏览器管理器的 AsyncIO 兼容函数
-    return run_in_thread_if_asyncio(_get_access_token_impl)
+    token = run_in_thread_if_asyncio(_get_access_token_impl)
+    if token:
+        token_manager.set_teacher_token(token)
+    return token
+
+
+def clear_access_token():
+    """清除教师端access_token缓存（切换账号、登出或接口返回401时调用）"""
+    get_token_manager().clear_teacher_token()
+    logger.info("🗑️ 教师端access_token缓存已清除")
 
 
 def _get_access_token_impl() -> Optional[str]:
@@ -57,7 +75,7 @@ def _get_access_token_impl() -> Optional[str]:
                 print("\n💡 检测到已保存的教师端账号")
                 use_saved = input("是否使用已保存的账号？(yes/no，默认yes): ").strip().lower()
 
-                if use_saved in ['', 'yes', 'y', '是']:
+                if is_yes(use_saved, default=True):
                     print(f"✅ 使用已保存的账号: {config_username[:3]}****")
                     logger.info(f"使用已保存的账号: {config_username[:3]}****")
                     username = config_username
@@ -24,7 +24,7 @@ from src.core.browser import (
     BrowserType,
     run_in_thread_if_asyncio
 )
-from src.utils.text import normalize_text, get_chapters
+from src.utils.text import normalize_text, get_chapters, is_yes
 from src.core.headers import get_api_headers
 from src.answering.base_answer import BaseAnswer
 from src.answering.browser_ops import wait_for_success_hint
@@ -36,6 +36,20 @@ logger = logging.getLogger(__name__)
 _question_bank_data = None
 _question_bank_lock = threading.Lock()
 
+# 课程页面操作菜单（预先拼好，一次 print 输出）
+_OPERATION_MENU = "\n".join([
+    "\n" + "=" * 60,
+    "[INFO] 操作菜单",
+    "=" * 60,
+    "1. 开始做题（兼容模式）",
+    "2. 开始做题（API模式）",
+    "3. 重新作答（兼容模式）",
+    "4. 重新作答（API模式）",
+    "5. 导入题库",
+    "0. 退出",
+    "=" * 60,
+])
+
 
 # ============================================================================
 # 浏览器管理辅助函数（使用 BrowserManager）
@@ -329,7 +343,7 @@ def get_access_token(keep_browser_open: bool = False, skip_prompt: bool = False)
                     # CLI模式，询问用户是否使用已保存的账号
                     use_saved = input("是否使用已保存的账号？(yes/no，默认yes): ").strip().lower()
 
-                    if use_saved in ['', 'yes', 'y', '是']:
+                    if is_yes(use_saved, default=True):
                         print(f"[OK] 使用已保存的账号: {config_username[:3]}****")
                         logger.info(f"使用已保存的账号: {config_username[:3]}****")
                         username = config_username
@@ -464,29 +478,30 @@ def start_answering():
                             close_browser()
                             break
 
-                        try:
-                            choice_idx = int(choice_input) - 1
-                            if 0 <= choice_idx < len(filtered_courses):
-                                selected_course = filtered_courses[choice_idx]
-                                lesson_name = selected_course.get('lessonName', 'N/A')
-                                ecourse_id = selected_course.get('eCourseID', 'N/A')
-
-                                print(f"\n你选择了: {lesson_name}")
-                                print(f"eCourseID: {ecourse_id}")
-
-                                confirm = input("\n是否跳转到该课程页面？(yes/no): ").strip().lower()
-                                if confirm in ['yes', 'y', '是']:
-                                    # 使用已有的浏览器实例跳转
-                                    navigate_to_course_page(ecourse_id, page, access_token)
-                                    # 跳转完成后关闭浏览器
-                                    close_browser()
-                                    break
-                                else:
-                                    print("已取消")
-                            else:
-                                print(f"[ERROR] 无效的选择，请输入 0-{len(filtered_courses)} 之间的数字")
-                        except ValueError:
+                        if not choice_input.isdecimal():
                             print("[ERROR] 请输入有效的数字")
+                            continue
+
+                        choice_idx = int(choice_input) - 1
+                        if 0 <= choice_idx < len(filtered_courses):
+                            selected_course = filtered_courses[choice_idx]
+                            lesson_name = selected_course.get('lessonName', 'N/A')
+                            ecourse_id = selected_course.get('eCourseID', 'N/A')
+
+                            print(f"\n你选择了: {lesson_name}")
+                            print(f"eCourseID: {ecourse_id}")
+
+                            confirm = input("\n是否跳转到该课程页面？(yes/no): ").strip().lower()
+                            if is_yes(confirm):
+                                # 使用已有的浏览器实例跳转
+                                navigate_to_course_page(ecourse_id, page, access_token)
+                                # 跳转完成后关闭浏览器
+                                close_browser()
+                                break
+                            else:
+                                print("已取消")
+                        else:
+                            print(f"[ERROR] 无效的选择，请输入 0-{len(filtered_courses)} 之间的数字")
 
                 else:
                     print(f"[ERROR] API返回错误: {data.get('message', '未知错误')}")
@@ -678,16 +693,7 @@ def navigate_to_course_page(ecourse_id: str, page, access_token: str):
 
     def show_operation_menu():
         """显示操作菜单"""
-        print("\n" + "=" * 60)
-        print("[INFO] 操作菜单")
-        print("=" * 60)
-        print("1. 开始做题（兼容模式）")
-        print("2. 开始做题（API模式）")
-        print("3. 重新作答（兼容模式）")
-        print("4. 重新作答（API模式）")
-        print("5. 导入题库")
-        print("0. 退出")
-        print("=" * 60)
+        print(_OPERATION_MENU, flush=True)
 
     try:
         print(f"\n正在跳转到课程页面...")
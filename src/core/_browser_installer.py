@@ -5,15 +5,52 @@
 所有函数均为无状态的模块级函数（原 BrowserManager 的 installer 方法提取）。
 """
 
+from collections import deque
 from typing import Dict, Tuple
 from pathlib import Path
+import re
 import subprocess
+import threading
 import logging
 import sys
 import os
 
 logger = logging.getLogger(__name__)
 
+# playwright install 的超时时间与失败时保留的输出行数
+_INSTALL_TIMEOUT_SECONDS = 600
+_INSTALL_OUTPUT_TAIL_LINES = 50
+# 下载进度行（以 \r 刷新，如 "|■■■   | 30% of 150 MiB"）每跨过 10% 才记录一次
+_PROGRESS_PERCENT_RE = re.compile(r'(\d{1,3})%')
+_PROGRESS_LOG_STEP = 10
+
+
+def _kill_process_tree(process: subprocess.Popen) -> None:
+    """强制结束子进程及其全部后代。
+
+    playwright install 由 Node driver 孙进程执行下载，该进程继承了 stdout 管道；
+    只杀 Python 启动器时管道不会关闭，读取循环仍会阻塞，因此需要递归结束整棵进程树。
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    if psutil is not None:
+        try:
+            for child in psutil.Process(process.pid).children(recursive=True):
+                try:
+                    child.kill()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            logger.debug(f"结束 playwright install 子进程树失败: {e}")
+
+    try:
+        process.kill()
+    except OSError:
+        pass
+
 
 def check_playwright_browser() -> Tuple[bool, str]:
     """检查 Playwright 浏览器是否已安装。
@@ -51,19 +88,58 @@ def install_playwright_browser(show_progress: bool = True) -> Tuple[bool, str]:
         logger.info("开始安装 Playwright Chromium 浏览器...")
 
     try:
-        result = subprocess.run(
+        # 逐行读取子进程输出：下载进度实时写入日志，不再等进程结束后一次性缓冲全部输出；
+        # 失败时只保留最后若干行作为错误信息
+        process = subprocess.Popen(
             [sys.executable, "-m", "playwright", "install", "chromium"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=600  # 10分钟超时
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
         )
-
-        if result.returncode == 0:
+        tail = deque(maxlen=_INSTALL_OUTPUT_TAIL_LINES)
+
+        # 10分钟超时：到时强制结束子进程，读取循环随之结束
+        timed_out = threading.Event()
+
+        def _kill_on_timeout():
+            timed_out.set()
+            _kill_process_tree(process)
+
+        watchdog = threading.Timer(_INSTALL_TIMEOUT_SECONDS, _kill_on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+        last_progress_step = None
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                match = _PROGRESS_PERCENT_RE.search(line)
+                if match:
+                    step = int(match.group(1)) // _PROGRESS_LOG_STEP
+                    if step == last_progress_step:
+                        continue
+                    last_progress_step = step
+                tail.append(line)
+                if show_progress:
+                    logger.info(f"[playwright] {line}")
+            returncode = process.wait()
+        finally:
+            watchdog.cancel()
+            process.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(process.args, _INSTALL_TIMEOUT_SECONDS)
+
+        if returncode == 0:
             if show_progress:
                 logger.info("[OK] Playwright 浏览器安装成功！")
             return True, ""
         else:
-            error_msg = result.stderr or result.stdout or "未知错误"
+            error_msg = "\n".join(tail) or "未知错误"
             if show_progress:
                 logger.error(f"✗ 浏览器安装失败: {error_msg}")
             return False, error_msg
@@ -208,16 +284,17 @@ def get_available_browser_channel() -> Tuple[str, str]:
         settings = get_settings_manager()
         config_channel = settings.get_browser_channel()
 
+        # 系统浏览器只检测一次，配置通道校验与自动选择共用同一结果
+        system_browsers = detect_system_browsers()
+
         if config_channel and config_channel != BrowserChannel.BUNDLED.value:
             if config_channel in ['chrome', 'msedge']:
-                system_browsers = detect_system_browsers()
                 if config_channel in system_browsers:
                     logger.info(f"[OK] 使用配置的浏览器通道: {config_channel}")
                     return config_channel, f"使用系统浏览器: {BrowserChannel.from_string(config_channel).get_display_name()}"
                 else:
                     logger.warning(f"⚠️ 配置的浏览器通道 '{config_channel}' 不可用，将尝试其他选项")
 
-        system_browsers = detect_system_browsers()
         if system_browsers:
             if 'chrome' in system_browsers:
                 logger.info("[OK] 自动选择系统 Google Chrome")
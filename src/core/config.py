@@ -29,25 +29,29 @@ class APIRateLevel(Enum):
 
     def get_delay_ms(self) -> int:
         """获取延迟毫秒数"""
-        delays = {
-            APIRateLevel.LOW: 1000,
-            APIRateLevel.MEDIUM: 2000,
-            APIRateLevel.MEDIUM_HIGH: 3000,
-            APIRateLevel.HIGH: 5000,
-            APIRateLevel.VERY_HIGH: 10000
-        }
-        return delays[self]
+        return _RATE_DELAYS_MS[self]
 
     def get_display_name(self) -> str:
         """获取显示名称"""
-        names = {
-            APIRateLevel.LOW: "低（1000ms）",
-            APIRateLevel.MEDIUM: "中（2000ms）",
-            APIRateLevel.MEDIUM_HIGH: "中高（3000ms）",
-            APIRateLevel.HIGH: "高（5000ms）",
-            APIRateLevel.VERY_HIGH: "极高（10000ms）"
-        }
-        return names[self]
+        return _RATE_DISPLAY_NAMES[self]
+
+
+# 速率级别映射表只在导入时构建一次（get_delay_ms 在每次 API 请求前都会被调用）
+_RATE_DELAYS_MS = {
+    APIRateLevel.LOW: 1000,
+    APIRateLevel.MEDIUM: 2000,
+    APIRateLevel.MEDIUM_HIGH: 3000,
+    APIRateLevel.HIGH: 5000,
+    APIRateLevel.VERY_HIGH: 10000
+}
+
+_RATE_DISPLAY_NAMES = {
+    APIRateLevel.LOW: "低（1000ms）",
+    APIRateLevel.MEDIUM: "中（2000ms）",
+    APIRateLevel.MEDIUM_HIGH: "中高（3000ms）",
+    APIRateLevel.HIGH: "高（5000ms）",
+    APIRateLevel.VERY_HIGH: "极高（10000ms）"
+}
 
 
 # ---------- 默认配置常量（单一来源，避免 _get_default_config / get_* / 迁移 三处漂移） ----------
@@ -246,13 +250,22 @@ class SettingsManager:
         return self._get_cred("teacher", ["username", "password"])
 
     def set_teacher_credentials(self, username: str, password: str) -> bool:
-        """设置教师端凭据"""
+        """设置教师端凭据（同时作废旧账号的 token 缓存）"""
+        self._invalidate_teacher_token()
         return self._set_cred("teacher", {"username": username, "password": password})
 
     def clear_teacher_credentials(self) -> bool:
-        """清除教师端凭据"""
+        """清除教师端凭据（同时作废 token 缓存）"""
+        self._invalidate_teacher_token()
         return self._clear_cred("teacher", ["username", "password"])
 
+    @staticmethod
+    def _invalidate_teacher_token():
+        """凭据变更后清除教师端 token 缓存，避免继续使用旧账号的 token"""
+        # 延迟导入：config 不依赖 auth 包的其余部分
+        from src.auth.token_manager import get_token_manager
+        get_token_manager().clear_teacher_token()
+
     # --- WeBan ---
 
     def get_weban_credentials(self) -> tuple[Optional[str], Optional[str], Optional[str]]:
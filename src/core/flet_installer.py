@@ -8,6 +8,9 @@ Flet Library Installation Manager
 如果遇到运行时下载问题，请查看：docs/FLET_SETUP.md
 """
 
+import hashlib
+import re
+import shlex
 import subprocess
 import sys
 import importlib.metadata as importlib_metadata
@@ -25,6 +28,9 @@ class FletInstaller:
     MIN_FLET_VERSION = "0.80.0"
     RECOMMENDED_FLET_VERSION = "0.82.0"
 
+    # requirements.txt 安装成功后写入应用数据目录的哈希标记文件
+    REQUIREMENTS_HASH_FILE = "requirements.hash"
+
     def __init__(self):
         """初始化 Flet 安装管理器"""
         self._flet_checked = False
@@ -72,13 +78,12 @@ class FletInstaller:
             logger.info("开始安装 Flet 库...")
 
         try:
-            # 步骤 1: 安装 flet 包
+            # flet 与 flet-desktop（Flet 0.8.0+ 必需）合并为一次 pip 调用，
+            # 只启动一次解释器、只做一次依赖解析
             if show_progress:
-                logger.info("正在安装 flet 包...")
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", f"flet>={self.RECOMMENDED_FLET_VERSION}"],
-                capture_output=True,
-                text=True,
+                logger.info("正在安装 flet 和 flet-desktop 包...")
+            result = self._pip_install(
+                f"flet>={self.RECOMMENDED_FLET_VERSION}", "flet-desktop",
                 timeout=300  # 5分钟超时
             )
 
@@ -89,27 +94,7 @@ class FletInstaller:
                 return False, error_msg
 
             if show_progress:
-                logger.info("✓ Flet 包安装成功")
-
-            # 步骤 2: 安装 flet-desktop 包（Flet 0.8.0+ 必需）
-            if show_progress:
-                logger.info("正在安装 flet-desktop 包...")
-            result_desktop = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "flet-desktop"],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5分钟超时
-            )
-
-            if result_desktop.returncode != 0:
-                # flet-desktop 安装失败，但尝试继续
-                error_msg = result_desktop.stderr or result_desktop.stdout or "未知错误"
-                if show_progress:
-                    logger.warning(f"⚠ flet-desktop 安装失败: {error_msg}")
-                    logger.warning("⚠ 桌面应用可能无法运行，但 Web 模式仍可使用")
-
-            if show_progress and result_desktop.returncode == 0:
-                logger.info("✓ flet-desktop 安装成功")
+                logger.info("✓ flet / flet-desktop 包安装成功")
 
             # 验证安装
             is_installed, msg, version = self.check_flet_installed()
@@ -155,12 +140,7 @@ class FletInstaller:
                 return False, f"指定的文件不是 wheel 文件: {wheel_path}"
 
             # 使用 pip 安装本地 wheel 文件
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", str(wheel_file)],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+            result = self._pip_install(str(wheel_file), timeout=300)
 
             if result.returncode == 0:
                 logger.info("✓ Flet 从本地 wheel 文件安装成功")
@@ -202,16 +182,25 @@ class FletInstaller:
             if not req_file.exists():
                 return False, f"目录中未找到 requirements.txt: {requirements_dir}"
 
+            # requirements.txt 与上次成功安装时一致（同一解释器），且每个依赖都仍满足版本要求，则跳过 pip
+            req_bytes = req_file.read_bytes()
+            req_hash = hashlib.blake2b(
+                req_bytes + sys.executable.encode("utf-8"), digest_size=16
+            ).hexdigest()
+            hash_file = self._requirements_hash_path()
+            if (self._read_requirements_hash(hash_file) == req_hash
+                    and self._requirements_satisfied(req_bytes.decode("utf-8", errors="replace"))):
+                is_installed, msg, version = self.check_flet_installed()
+                if is_installed:
+                    logger.info("✓ requirements.txt 未变化，跳过 pip install")
+                    return True, f"Flet v{version} 已安装"
+
             # 使用 pip 安装
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "-r", str(req_file)],
-                capture_output=True,
-                text=True,
-                timeout=600  # 10分钟超时
-            )
+            result = self._pip_install("-r", str(req_file), timeout=600)  # 10分钟超时
 
             if result.returncode == 0:
                 logger.info("✓ Flet 从 requirements.txt 安装成功")
+                self._write_requirements_hash(hash_file, req_hash)
 
                 # 验证安装
                 is_installed, msg, version = self.check_flet_installed()
@@ -330,6 +319,80 @@ class FletInstaller:
         """
         return False, error_msg.strip()
 
+    @staticmethod
+    def _pip_install(*args: str, timeout: int) -> subprocess.CompletedProcess:
+        """用当前解释器执行 pip install，完整命令行只在 DEBUG 级别输出"""
+        cmd = [
+            sys.executable, "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input",
+            *args,
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"执行: {shlex.join(cmd)}")
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+    def _requirements_hash_path(self) -> Path:
+        """应用数据目录（与用户配置文件同目录）中的 requirements 哈希标记路径"""
+        from src.core.config import SettingsManager
+        return SettingsManager.default_config_file().parent / self.REQUIREMENTS_HASH_FILE
+
+    @staticmethod
+    def _requirements_satisfied(requirements_text: str) -> bool:
+        """检查 requirements.txt 中的每个依赖是否都已安装且版本满足要求。
+
+        无法解析的行（如 -r / --index-url 等 pip 选项）一律视为不满足，交给 pip 处理。
+        """
+        try:
+            from packaging.requirements import InvalidRequirement, Requirement
+        except ImportError:
+            Requirement = None
+
+        for raw_line in requirements_text.splitlines():
+            line = raw_line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            if line.startswith("-"):
+                return False
+
+            if Requirement is None:
+                # 没有 packaging 时只检查包是否存在
+                name, specifier, marker = re.split(r"[\s<>=!~;\[]", line, maxsplit=1)[0], None, None
+            else:
+                try:
+                    req = Requirement(line)
+                except InvalidRequirement:
+                    return False
+                name, specifier, marker = req.name, req.specifier, req.marker
+
+            if marker is not None and not marker.evaluate():
+                continue
+            try:
+                installed_version = importlib_metadata.version(name)
+            except importlib_metadata.PackageNotFoundError:
+                logger.info(f"依赖 {name} 未安装，需要重新执行 pip install")
+                return False
+            if specifier and not specifier.contains(installed_version, prereleases=True):
+                logger.info(f"依赖 {name} 版本 {installed_version} 不满足 {specifier}，需要重新执行 pip install")
+                return False
+
+        return True
+
+    @staticmethod
+    def _read_requirements_hash(hash_file: Path) -> Optional[str]:
+        try:
+            return hash_file.read_text(encoding="ascii").strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @staticmethod
+    def _write_requirements_hash(hash_file: Path, req_hash: str) -> None:
+        try:
+            hash_file.parent.mkdir(parents=True, exist_ok=True)
+            hash_file.write_text(req_hash, encoding="ascii")
+        except OSError as e:
+            # 标记写不进去只会导致下次重新执行 pip，不影响安装结果
+            logger.debug(f"写入 requirements 哈希失败: {e}")
+
     def _version_comparable(self, version_string: str) -> tuple:
         """
         将版本字符串转换为可比较的元组
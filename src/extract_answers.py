@@ -6,22 +6,14 @@
 import sys
 import os
 
-# 设置标准输出编码为UTF-8，支持emoji
-if sys.platform == 'win32':
-    try:
-        import codecs
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
-        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer)
-    except Exception:
-        # 如果失败，使用环境变量
-        os.environ['PYTHONIOENCODING'] = 'utf-8'
-else:
-    os.environ['PYTHONIOENCODING'] = 'utf-8'
-
 # 添加项目根目录到路径（确保能导入src模块）
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+# 设置标准输出编码为UTF-8，支持emoji
+from src.utils.console import configure_utf8_console
+configure_utf8_console()
+
 from src.extraction.extractor import extract_course_answers
 
 
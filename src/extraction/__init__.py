@@ -4,20 +4,35 @@
 包含答案提取、导出和导入功能。
 """
 
-# 延迟导入以避免循环依赖
+from importlib import import_module
+
 
 def get_extractor():
     """获取 Extractor 类（延迟导入）"""
     from src.extraction.extractor import Extractor
     return Extractor
 
-# 为了向后兼容，仍然提供直接导入
-from src.extraction.extractor import Extractor, extract_course_answers, extract_questions, extract_single_course
-from src.extraction.exporter import DataExporter
-from src.extraction.importer import QuestionBankImporter
 
-__all__ = [
-    'Extractor', 'extract_course_answers', 'extract_questions', 'extract_single_course',
-    'DataExporter', 'QuestionBankImporter',
-    'get_extractor',
-]
+# 为了向后兼容，仍然支持 from src.extraction import Xxx，但按需加载：
+# 只用到题库导入时不会连带加载 extractor（及其浏览器依赖）
+_EXPORTS = {
+    'Extractor': ('src.extraction.extractor', 'Extractor'),
+    'extract_course_answers': ('src.extraction.extractor', 'extract_course_answers'),
+    'extract_questions': ('src.extraction.extractor', 'extract_questions'),
+    'extract_single_course': ('src.extraction.extractor', 'extract_single_course'),
+    'DataExporter': ('src.extraction.exporter', 'DataExporter'),
+    'QuestionBankImporter': ('src.extraction.importer', 'QuestionBankImporter'),
+}
+
+__all__ = [*_EXPORTS, 'get_extractor']
+
+
+def __getattr__(name):
+    """按需加载兼容导出，避免 import src.extraction 时加载全部子模块。"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr_name = _EXPORTS[name]
+    value = getattr(import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
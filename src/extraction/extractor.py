@@ -9,6 +9,7 @@ import time
 # 导入浏览器管理器
 from src.core.browser import get_browser_manager, BrowserType
 from src.core.headers import get_api_headers
+from src.utils.text import is_yes
 
 
 class Extractor:
@@ -55,7 +56,7 @@ class Extractor:
                         print("\n💡 检测到已保存的教师端账号")
                         use_saved = input("是否使用已保存的账号？(yes/no，默认yes): ").strip().lower()
 
-                        if use_saved in ['', 'yes', 'y', '是']:
+                        if is_yes(use_saved, default=True):
                             print(f"✅ 使用已保存的账号: {config_username[:3]}****")
                             username = config_username
                             password = config_password
@@ -414,14 +415,13 @@ class Extractor:
             choice = input("请输入选项：").strip()
             if choice == "0":
                 return None
-            try:
-                choice_int = int(choice)
-                if 1 <= choice_int <= len(items):
-                    return choice_int - 1
-                else:
-                    print("❌ 无效的选项，请重新输入")
-            except ValueError:
+            if not choice.isdecimal():
                 print("❌ 请输入数字")
+                continue
+            choice_int = int(choice)
+            if 1 <= choice_int <= len(items):
+                return choice_int - 1
+            print("❌ 无效的选项，请重新输入")
 
     def select_grade(self, class_list: List[Dict]) -> Optional[str]:
         """
@@ -13,6 +13,10 @@ class QuestionBankImporter:
     def __init__(self):
         self.data = None
         self.bank_type = None  # "single" 或 "multiple"
+        # 最近一次解析结果 (源数据, 题库类型, 解析结果)。
+        # 导入一次题库会先后用于控制台输出、统计预览和课程校验，
+        # 缓存后只遍历一次全部题目；data 被替换时自动失效
+        self._parsed_cache = None
 
     def import_from_file(self, file_path: str) -> bool:
         """
@@ -94,12 +98,16 @@ class QuestionBankImporter:
         """
         if self.bank_type != "single":
             return None
-        
+
+        cached = self._get_cached_parse()
+        if cached is not None:
+            return cached
+
         class_info = self.data.get("class", {})
         course_info = class_info.get("course", {})
         chapters = course_info.get("chapters", [])
         
-        return {
+        return self._cache_parse({
             "class": {
                 "id": class_info.get("id", ""),
                 "name": class_info.get("name", ""),
@@ -114,7 +122,7 @@ class QuestionBankImporter:
             },
             "chapters": chapters,
             "statistics": self._calculate_statistics(chapters)
-        }
+        })
 
     def parse_multiple_courses(self) -> Optional[Dict]:
         """
@@ -126,6 +134,10 @@ class QuestionBankImporter:
         if self.bank_type != "multiple":
             return None
 
+        cached = self._get_cached_parse()
+        if cached is not None:
+            return cached
+
         class_info = self.data.get("class", {})
 
         # 支持两种多课程格式：
@@ -140,7 +152,7 @@ class QuestionBankImporter:
             for course in course_list:
                 chapters.extend(course.get("chapters", []))
 
-        return {
+        return self._cache_parse({
             "class": {
                 "id": class_info.get("id", ""),
                 "name": class_info.get("name", ""),
@@ -150,7 +162,21 @@ class QuestionBankImporter:
             "courses": course_list,
             "chapters": chapters,
             "statistics": self._calculate_statistics(chapters, course_list)
-        }
+        })
+
+    def _get_cached_parse(self) -> Optional[Dict]:
+        """返回当前 data/bank_type 对应的缓存解析结果，没有则返回 None。"""
+        if self._parsed_cache is None:
+            return None
+        source, bank_type, parsed = self._parsed_cache
+        if source is self.data and bank_type == self.bank_type:
+            return parsed
+        return None
+
+    def _cache_parse(self, parsed: Dict) -> Dict:
+        """记录当前 data/bank_type 的解析结果并原样返回。"""
+        self._parsed_cache = (self.data, self.bank_type, parsed)
+        return parsed
 
     def _calculate_statistics(self, chapters: List[Dict], course_list: List[Dict] = None) -> Dict:
         """
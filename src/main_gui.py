@@ -11,8 +11,9 @@ from pathlib import Path
 
 # 添加项目根目录到Python路径（支持开发和打包环境）
 project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+_PROJECT_ROOT_STR = str(project_root)
+if _PROJECT_ROOT_STR not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT_STR)
 
 # 在导入 flet 之前设置环境变量
 # 让 Flet 使用 pip 而不是 uv
@@ -96,6 +97,15 @@ class MainApp:
         self.settings_view = SettingsView(page, main_app=self)
         self.about_view = AboutView(page)
 
+        # 导航索引 -> 视图（顺序与导航栏 destinations 一致）
+        self.destination_views = (
+            self.answering_view,
+            self.extraction_view,
+            self.plugin_center_view,
+            self.settings_view,
+            self.about_view,
+        )
+
         # 缓存每个视图的内容（保持状态）
         self.cached_contents = {
             0: None,  # 评估答题
@@ -171,9 +181,7 @@ class MainApp:
         """初始化插件系统"""
         print("[MainApp] Initializing plugin system...")
 
-        # 扫描插件目录
-        # __file__ 是 src/main_gui.py，所以 parent.parent 就是项目根目录
-        project_root = Path(__file__).parent.parent
+        # 扫描插件目录（project_root 在模块加载时已计算）
         plugins_dir = project_root / "plugins"
 
         print(f"[MainApp] Project root: {project_root}")
@@ -698,18 +706,9 @@ class MainApp:
         if cached_content is None:
             # 如果缓存不存在（不应该发生），则创建并缓存
             print(f"[MainApp] View {self.current_destination} not cached, creating...")
-            if self.current_destination == 0:
-                cached_content = self.answering_view.get_content()
-            elif self.current_destination == 1:
-                cached_content = self.extraction_view.get_content()
-            elif self.current_destination == 2:
-                cached_content = self.plugin_center_view.get_content()
-            elif self.current_destination == 3:
-                cached_content = self.settings_view.get_content()
-            elif self.current_destination == 4:
-                cached_content = self.about_view.get_content()
-            else:
+            if not 0 <= self.current_destination < len(self.destination_views):
                 return
+            cached_content = self.destination_views[self.current_destination].get_content()
 
             # 缓存新创建的内容
             self.cached_contents[self.current_destination] = cached_content
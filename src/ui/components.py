@@ -653,6 +653,8 @@ class AnswerProgressDialog:
         self._theme = _PROGRESS_THEMES.get(theme, _PROGRESS_THEMES["blue"])
         self._show_log_panel = show_log_panel
         self._on_stop = on_stop
+        # 最近一次显示的 (进度条值, 百分比文本, 计数文本)，用于跳过重复刷新
+        self._last_display = None
 
         # 百分比文本（大字/小字）
         percent_size = 32 if show_big_percent else 16
@@ -760,21 +762,30 @@ class AnswerProgressDialog:
         return self._dialog
 
     def update_progress(self, current=None, total=None, message: str = "") -> None:
-        """更新进度。有 current/total 时显示具体百分比与计数；否则显示不确定动画。"""
+        """更新进度。有 current/total 时显示具体百分比与计数；否则显示不确定动画。
+
+        显示内容与上次相同时不再调度 UI 刷新（答题过程中同一计数会被重复上报）。
+        """
         if not self._page:
             return
 
+        if current is not None and total is not None and total > 0:
+            progress_value = min(current / total, 1.0)
+            display = (progress_value, f"{int(progress_value * 100)}%", f"{current}/{total}")
+        else:
+            display = (None, "⏳", message or "正在处理...")
+
+        if display == self._last_display:
+            return
+        self._last_display = display
+
         async def update_ui():
             try:
-                if current is not None and total is not None and total > 0:
-                    progress_value = min(current / total, 1.0)
-                    self._progress_bar.value = progress_value
-                    self._percent_text.value = f"{int(progress_value * 100)}%"
-                    self._count_text.value = f"{current}/{total}"
-                else:
-                    self._progress_bar.value = None
-                    self._percent_text.value = "⏳"
-                    self._count_text.value = message or "正在处理..."
+                (
+                    self._progress_bar.value,
+                    self._percent_text.value,
+                    self._count_text.value,
+                ) = display
                 self._page.update()
             except Exception as e:
                 print(f"❌ 进度UI更新异常: {e}")
@@ -1,8 +1,10 @@
 """Shared visual tokens and Flet theme configuration for the desktop app."""
 
-import flet as ft
+import functools
 import platform
 
+import flet as ft
+
 
 class Fonts:
     """Font family tokens for clear text rendering across platforms."""
@@ -15,15 +17,10 @@ class Fonts:
     LINUX = "Ubuntu, Noto Sans, sans-serif"
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_system_font() -> str:
-        """获取适合当前系统的清晰字体"""
-        system = platform.system()
-        if system == "Windows":
-            return Fonts.WINDOWS
-        elif system == "Darwin":
-            return Fonts.MACOS
-        else:
-            return Fonts.LINUX
+        """获取适合当前系统的清晰字体（结果在进程内不变，缓存后 Fonts.text 不再重复探测平台）"""
+        return _SYSTEM_FONTS.get(platform.system(), Fonts.LINUX)
 
     @staticmethod
     def text(**kwargs) -> "ft.TextStyle":
@@ -40,6 +37,12 @@ class Fonts:
         return ft.TextStyle(**kwargs)
 
 
+_SYSTEM_FONTS = {
+    "Windows": Fonts.WINDOWS,
+    "Darwin": Fonts.MACOS,
+}
+
+
 class Palette:
     """Color tokens used by the modern application shell and core views."""
 
@@ -6,9 +6,13 @@ This module contains the UI components for the answering page.
 
 import flet as ft
 import logging
+import time
+from itertools import groupby
+from typing import List, Tuple
 
 logger = logging.getLogger(__name__)
 from src.auth.student import (
+    fill_uncompleted_chapters,
     get_student_access_token,
     get_student_courses,
     get_uncompleted_chapters,
@@ -45,6 +49,26 @@ from src.extraction.bank_service import apply_bank_result, load_question_bank
 from src.ui.theme import Fonts, Palette, Radius
 
 
+def _flat_chapter_title(item: dict) -> str:
+    """组合扁平化知识点所属章节的完整标题，例如“第2章 数据通信基础”"""
+    chapter_num = item.get('title', '')
+    chapter_name = item.get('titleContent', item.get('title', '未知章节'))
+    return f"{chapter_num} {chapter_name}" if chapter_num and chapter_num != chapter_name else chapter_name
+
+
+def group_flat_uncompleted(uncompleted_list: List[dict]) -> List[Tuple[str, List[str]]]:
+    """
+    将扁平化的未完成知识点列表按章节分组（接口返回的数据已按章节排序）
+
+    Returns:
+        List[Tuple[str, List[str]]]: [(章节标题, [知识点名称, ...]), ...]
+    """
+    return [
+        (chapter_title, [item.get('knowledge', '未知知识点') for item in items])
+        for chapter_title, items in groupby(uncompleted_list, key=_flat_chapter_title)
+    ]
+
+
 class AnsweringView:
     """评估答题页面视图"""
 
@@ -68,6 +92,7 @@ class AnsweringView:
         self.access_token = None  # 存储获取的access_token
         self.progress_dialog = None  # 登录进度对话框
         self.course_list = []  # 存储课程列表
+        self._courses_content_cache = None  # (课程列表, 用户名, 已构建的课程列表界面)
         self.username = ""  # 存储登录的用户名
         self.current_course = None  # 当前选中的课程
         self.current_progress = None  # 当前课程进度信息
@@ -374,6 +399,7 @@ class AnsweringView:
             logger.debug("  - 清理内存状态")
             self.username = ""
             self.course_list = []
+            self._courses_content_cache = None
             self.current_course = None
             self.current_progress = None
             self.current_uncompleted = None
@@ -474,23 +500,8 @@ class AnsweringView:
                         self.course_list = courses
                         logger.info(f"✅ 成功获取 {len(courses)} 门课程")
 
-                        # 为每门课程获取未完成的知识点
-                        for course in courses:
-                            course_id = course.get('courseID')
-                            if course_id:
-                                try:
-                                    logger.debug(f"正在获取课程 {course.get('courseName')} 的未完成知识点...")
-                                    uncompleted = get_uncompleted_chapters(access_token, course_id)
-                                    if uncompleted and len(uncompleted) > 0:
-                                        course['uncompleted_knowledges'] = uncompleted
-                                        logger.info(f"  ✅ {course.get('courseName')}: {len(uncompleted)} 个未完成知识点")
-                                    else:
-                                        # 课程已完成或无未完成知识点
-                                        course['uncompleted_knowledges'] = []
-                                        logger.info(f"  ✅ {course.get('courseName')}: 已完成或无未完成知识点")
-                                except Exception as e:
-                                    logger.error(f"  ❌ 获取课程 {course.get('courseName')} 未完成知识点失败: {e}")
-                                    course['uncompleted_knowledges'] = []
+                        # 并发获取每门课程的未完成知识点
+                        fill_uncompleted_chapters(access_token, courses)
 
                         # 关闭进度对话框
                         self.page.pop_dialog()
@@ -539,9 +550,22 @@ class AnsweringView:
         """
         获取课程列表界面内容
 
+        课程列表未变化时（例如从课程详情返回）直接复用上次构建的界面，
+        只有登录、刷新等替换了 self.course_list 之后才重新构建。
+
         Returns:
             ft.Column: 课程列表界面组件
         """
+        cache = self._courses_content_cache
+        if cache and cache[0] is self.course_list and cache[1] == self.username:
+            return cache[2]
+
+        content = self._build_courses_content()
+        self._courses_content_cache = (self.course_list, self.username, content)
+        return content
+
+    def _build_courses_content(self) -> ft.Column:
+        """构建课程列表界面（每门课程一张卡片）"""
         # 创建课程卡片列表
         course_cards = []
 
@@ -938,9 +962,7 @@ class AnsweringView:
                 logger.info(f"✅ 成功获取进度: {progress}")
 
                 # 获取未完成知识点列表
-                logger.debug("正在获取未完成知识点列表...")
-                uncompleted = get_uncompleted_chapters(self.access_token, course_id)
-                self.current_uncompleted = uncompleted or []
+                self.current_uncompleted = self._load_uncompleted_chapters(course_id, progress)
                 logger.info(f"✅ 成功获取 {len(self.current_uncompleted)} 个未完成知识点")
 
                 # 直接调用UI更新（Flet应该会自动处理线程切换）
@@ -986,10 +1008,8 @@ class AnsweringView:
                 logger.info(f"✅ 成功获取进度: {progress}")
 
                 # 获取未完成知识点列表
-                logger.debug("正在获取未完成知识点列表...")
                 course_id = self.current_course.get('courseID')
-                uncompleted = get_uncompleted_chapters(self.access_token, course_id)
-                self.current_uncompleted = uncompleted or []
+                self.current_uncompleted = self._load_uncompleted_chapters(course_id, progress)
                 logger.info(f"✅ 成功获取 {len(self.current_uncompleted)} 个未完成知识点")
 
                 # 在主线程中更新UI
@@ -1005,6 +1025,16 @@ class AnsweringView:
             # 在主线程中显示错误对话框
             self.page.run_thread(lambda: self._show_error_dialog("更新失败", f"更新进度信息时发生异常：{str(e)}"))
 
+    def _load_uncompleted_chapters(self, course_id: str, progress: dict) -> list:
+        """获取课程未完成知识点；页面进度显示已全部完成时直接返回空列表，省去一次接口请求"""
+        total = progress.get('total', 0)
+        if total > 0 and progress.get('completed', 0) >= total:
+            logger.info("✅ 课程知识点已全部完成，跳过未完成知识点查询")
+            return []
+
+        logger.debug("正在获取未完成知识点列表...")
+        return get_uncompleted_chapters(self.access_token, course_id) or []
+
     def _refresh_course_detail_ui(self):
         """刷新课程详情界面（在主线程中调用）"""
         # 重新生成课程详情内容
@@ -1204,7 +1234,6 @@ class AnsweringView:
                         result = auto_answer.run_auto_answer(max_questions=5)
                     else:
                         _log("⏳ 网站已自动跳转，继续做题...")
-                        import time
                         time.sleep(2)  # 等待跳转完成
                         result = auto_answer.continue_auto_answer(max_questions=5)
 
@@ -1238,7 +1267,6 @@ class AnsweringView:
                         )
 
                     # 检查是否还有更多知识点
-                    import time
                     time.sleep(1)
 
                     try:
@@ -1356,7 +1384,6 @@ class AnsweringView:
             _log("🎉 答题任务完成！")
 
             # 延迟后自动关闭对话框
-            import time
             time.sleep(2)
             if self.answer_dialog:
                 self.page.pop_dialog()
@@ -1404,19 +1431,7 @@ class AnsweringView:
             if not courses:
                 return None
 
-            for idx, course in enumerate(courses, 1):
-                course_id = course.get('courseID')
-                if course_id:
-                    try:
-                        logger.debug(f"[{idx}/{len(courses)}] 正在获取 {course.get('courseName')} 的未完成知识点...")
-                        uncompleted = get_uncompleted_chapters(
-                            access_token, course_id, delay_ms=0, max_retries=1
-                        )
-                        course['uncompleted_knowledges'] = uncompleted if uncompleted else []
-                    except Exception as ex:
-                        logger.error(f"  ❌ 获取课程 {course.get('courseName')} 未完成知识点失败: {ex}")
-                        course['uncompleted_knowledges'] = []
-            return courses
+            return fill_uncompleted_chapters(access_token, courses, max_retries=1)
 
         def on_done(courses):
             """UI 线程：更新课程列表"""
@@ -1832,69 +1847,53 @@ class AnsweringView:
             knowledge_count = 0
 
             if is_flat_format:
-                # 处理扁平化格式
-                current_chapter = None
-                for item in uncompleted_list:
-                    # 打印完整的数据项来调试
-                    logger.debug(f"DEBUG: 完整数据项 = {item}")
-
-                    chapter_num = item.get('title', '')  # 例如："第2章"
-                    chapter_name = item.get('titleContent', item.get('title', '未知章节'))  # 例如："数据通信基础"
-                    knowledge_name = item.get('knowledge', '未知知识点')
-
-                    # 组合完整的章节标题
-                    full_chapter_title = f"{chapter_num} {chapter_name}" if chapter_num and chapter_num != chapter_name else chapter_name
-
-                    # 调试输出
-                    logger.debug(f"DEBUG: 章节='{full_chapter_title}', 知识点='{knowledge_name}'")
-
-                    # 如果章节改变，添加章节标题
-                    if current_chapter != full_chapter_title:
-                        chapter_count += 1
-                        current_chapter = full_chapter_title
-                        knowledge_items.append(
-                            ft.Container(
-                                content=ft.Text(
-                                    full_chapter_title,
-                                    size=14,
-                                    weight=ft.FontWeight.BOLD,
-                                    color=ft.Colors.BLUE_800,
-                                ),
-                                padding=ft.Padding.only(top=15 if chapter_count > 1 else 0, bottom=8),
-                            )
-                        )
-
-                    # 添加知识点
-                    knowledge_count += 1
+                # 处理扁平化格式：先按章节分组，再逐章生成标题和知识点
+                for full_chapter_title, knowledge_names in group_flat_uncompleted(uncompleted_list):
+                    chapter_count += 1
                     knowledge_items.append(
                         ft.Container(
-                            content=ft.Row(
-                                [
-                                    ft.Container(
-                                        content=ft.Text(
-                                            str(knowledge_count),
-                                            size=12,
-                                            weight=ft.FontWeight.BOLD,
-                                            color=ft.Colors.WHITE,
-                                        ),
-                                        width=24,
-                                        height=24,
-                                        bgcolor=ft.Colors.BLUE_400,
-                                        border_radius=12,
-                                        alignment=ft.Alignment.CENTER,
-                                    ),
-                                    ft.Text(
-                                        knowledge_name,
-                                        size=13,
-                                        color=ft.Colors.GREY_800,
-                                        expand=True,
-                                    ),
-                                ],
-                                spacing=10,
+                            content=ft.Text(
+                                full_chapter_title,
+                                size=14,
+                                weight=ft.FontWeight.BOLD,
+                                color=ft.Colors.BLUE_800,
                             ),
-                            padding=ft.Padding.only(left=20, bottom=8),
+                            padding=ft.Padding.only(top=15 if chapter_count > 1 else 0, bottom=8),
                         )
                     )
+
+                    for knowledge_name in knowledge_names:
+                        # 添加知识点
+                        knowledge_count += 1
+                        knowledge_items.append(
+                            ft.Container(
+                                content=ft.Row(
+                                    [
+                                        ft.Container(
+                                            content=ft.Text(
+                                                str(knowledge_count),
+                                                size=12,
+                                                weight=ft.FontWeight.BOLD,
+                                                color=ft.Colors.WHITE,
+                                            ),
+                                            width=24,
+                                            height=24,
+                                            bgcolor=ft.Colors.BLUE_400,
+                                            border_radius=12,
+                                            alignment=ft.Alignment.CENTER,
+                                        ),
+                                        ft.Text(
+                                            knowledge_name,
+                                            size=13,
+                                            color=ft.Colors.GREY_800,
+                                            expand=True,
+                                        ),
+                                    ],
+                                    spacing=10,
+                                ),
+                                padding=ft.Padding.only(left=20, bottom=8),
+                            )
+                        )
             else:
                 # 处理嵌套格式（原始代码）
                 for chapter in uncompleted_list:
@@ -6,11 +6,11 @@ This module contains the UI components for the course certification page.
 
 import flet as ft
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 import json
 from pathlib import Path
-from src.extraction.importer import QuestionBankImporter
 from src.extraction.bank_service import apply_bank_result, load_question_bank
 from src.core.config import get_settings_manager
 from src.ui.components import (
@@ -845,7 +845,6 @@ class CourseCertificationView:
 
             self._append_log("\n🎉 答题任务完成！\n")
 
-            import time
             time.sleep(2)
             if self.answer_dialog:
                 self.page.pop_dialog()
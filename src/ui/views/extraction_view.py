@@ -13,7 +13,6 @@ import sys
 import subprocess
 from typing import Optional, List, Dict
 from src.extraction.extractor import Extractor
-from src.extraction.exporter import DataExporter
 from src.core.config import get_settings_manager
 from src.ui.components import (
     create_animated_switcher,
@@ -880,6 +879,7 @@ class ExtractionView:
 
         # 导出为 JSON
         try:
+            from src.extraction.exporter import DataExporter
             exporter = DataExporter(output_dir="output")
             file_path = exporter.export_data(result)
             abs_file_path = os.path.abspath(file_path)
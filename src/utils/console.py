@@ -0,0 +1,26 @@
+"""
+控制台编码工具
+
+仅供程序入口（main.py、src/extract_answers.py）调用，库模块不应在导入时修改标准流。
+"""
+
+import os
+import sys
+
+
+def configure_utf8_console() -> None:
+    """将 Windows 控制台的标准输出/错误切换为 UTF-8（修复 GBK 下 emoji 等字符无法输出）。
+
+    直接切换现有 TextIOWrapper 的编码，不再套一层 codecs writer；
+    PYTHONUTF8 让本进程启动的子进程也默认使用 UTF-8 模式。
+    """
+    if sys.platform != 'win32':
+        return
+
+    os.environ.setdefault('PYTHONUTF8', '1')
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(encoding='utf-8', errors='replace')
+        except (AttributeError, ValueError):
+            # 流为 None 或已被替换为不支持 reconfigure 的对象
+            pass
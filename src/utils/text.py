@@ -1,13 +1,33 @@
 """
 文本处理工具函数
 
-提供题库文本标准化和章节提取等共享功能。
+提供题库文本标准化、章节提取和控制台确认输入解析等共享功能。
 """
 
 import html
 import re
 from typing import Any, Dict, List
 
+# 控制台 yes/no 提示中视为肯定的回答
+YES_ANSWERS = frozenset({'yes', 'y', '是'})
+
+
+def is_yes(answer: str, default: bool = False) -> bool:
+    """
+    判断控制台确认输入是否为肯定回答。
+
+    Args:
+        answer: input() 得到的原始输入
+        default: 直接回车（空输入）时的返回值
+
+    Returns:
+        是否为肯定回答
+    """
+    answer = answer.strip().lower()
+    if not answer:
+        return default
+    return answer in YES_ANSWERS
+
 
 def normalize_text(text: str, preserve_angles: bool = False) -> str:
     """
@@ -78,6 +78,15 @@ class AnswerProgressDialogUpdateTests(unittest.TestCase):
         self.assertEqual(self.dlg._count_text.value, "正在初始化浏览器...")
         self.assertIsNone(self.dlg._progress_bar.value)
 
+    def test_repeated_progress_does_not_refresh_again(self):
+        self.dlg.update_progress(3, 10, "第3题")
+        count = self.page.update_count
+        self.dlg.update_progress(3, 10, "第3题（重试）")
+        self.assertEqual(self.page.update_count, count)
+        self.dlg.update_progress(4, 10)
+        self.assertEqual(self.page.update_count, count + 1)
+        self.assertEqual(self.dlg._count_text.value, "4/10")
+
     def test_update_progress_skips_when_no_page(self):
         dlg = AnswerProgressDialog(None, title="答题")
         # 无 page 时不应抛异常
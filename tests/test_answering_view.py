@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+
+from src.ui.views.answering_view import AnsweringView, group_flat_uncompleted
+
+
+class GroupFlatUncompletedTests(unittest.TestCase):
+    def test_groups_consecutive_items_by_chapter(self):
+        items = [
+            {'title': '第1章', 'titleContent': '绪论', 'knowledge': '1.1'},
+            {'title': '第1章', 'titleContent': '绪论', 'knowledge': '1.2'},
+            {'title': '第2章', 'titleContent': '数据通信基础', 'knowledge': '2.1'},
+        ]
+
+        self.assertEqual(group_flat_uncompleted(items), [
+            ('第1章 绪论', ['1.1', '1.2']),
+            ('第2章 数据通信基础', ['2.1']),
+        ])
+
+    def test_title_without_content_is_not_repeated(self):
+        items = [{'title': '附录', 'knowledge': 'A'}, {'title': '附录'}]
+
+        self.assertEqual(group_flat_uncompleted(items), [('附录', ['A', '未知知识点'])])
+
+
+class CoursesContentCacheTests(unittest.TestCase):
+    def _view(self):
+        view = AnsweringView(mock.Mock())
+        view.username = "student"
+        view.course_list = [{'courseID': 'c1', 'courseName': '网络基础', 'kpCount': 3, 'completeCount': 1}]
+        return view
+
+    def test_unchanged_course_list_reuses_built_content(self):
+        view = self._view()
+
+        with mock.patch.object(view, "_build_courses_content", wraps=view._build_courses_content) as build:
+            first = view._get_courses_content()
+            second = view._get_courses_content()
+
+        self.assertIs(first, second)
+        self.assertEqual(build.call_count, 1)
+
+    def test_replaced_course_list_rebuilds_content(self):
+        view = self._view()
+        first = view._get_courses_content()
+
+        view.course_list = list(view.course_list)
+
+        self.assertIsNot(view._get_courses_content(), first)
+
+
+class LoadUncompletedChaptersTests(unittest.TestCase):
+    def test_fully_completed_course_skips_request(self):
+        view = AnsweringView(mock.Mock())
+
+        with mock.patch("src.ui.views.answering_view.get_uncompleted_chapters") as fetch:
+            result = view._load_uncompleted_chapters("c1", {'total': 4, 'completed': 4})
+
+        self.assertEqual(result, [])
+        fetch.assert_not_called()
+
+    def test_unfinished_course_fetches_uncompleted(self):
+        view = AnsweringView(mock.Mock())
+        view.access_token = "token"
+
+        with mock.patch("src.ui.views.answering_view.get_uncompleted_chapters",
+                        return_value=None) as fetch:
+            result = view._load_uncompleted_chapters("c1", {'total': 4, 'completed': 3})
+
+        self.assertEqual(result, [])
+        fetch.assert_called_once_with("token", "c1")
+
+
+if __name__ == "__main__":
+    unittest.main()
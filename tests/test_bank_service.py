@@ -6,9 +6,12 @@ apply_bank_result 的状态语义（成功存入 / 不匹配清除 / 错误保
 
 import json
 import os
+import subprocess
 import sys
 import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 # load_question_bank 内部保留了原 _process 的 emoji print（如 "❌"），
 # Windows GBK 控制台 stdout 默认无法编码 emoji，这里把测试 stdout 切到 utf-8。
@@ -183,6 +186,27 @@ class LoadQuestionBankTests(unittest.TestCase):
         self.assertEqual(result.mismatch["selected_name"], "认证课")
 
 
+class ImporterParseCacheTests(unittest.TestCase):
+    def test_parse_is_reused_until_data_changes(self):
+        from src.extraction.importer import QuestionBankImporter
+
+        path = _write_temp_json(_single_bank())
+        self.addCleanup(os.unlink, path)
+        importer = QuestionBankImporter()
+        self.assertTrue(importer.import_from_file(path))
+
+        with mock.patch.object(importer, "_calculate_statistics",
+                               wraps=importer._calculate_statistics) as stats:
+            first = importer.parse_single_course()
+            importer.format_output()
+            self.assertIs(importer.parse_single_course(), first)
+            self.assertEqual(stats.call_count, 1)
+
+            self.assertTrue(importer.import_from_file(path))
+            self.assertIsNot(importer.parse_single_course(), first)
+            self.assertEqual(stats.call_count, 2)
+
+
 class ApplyBankResultTests(unittest.TestCase):
     def test_success_sets_data(self):
         result = BankLoadResult(success=True, data={"some": "bank"})
@@ -282,5 +306,28 @@ class RoundTripTests(unittest.TestCase):
         self.assertGreater(parsed["statistics"]["totalQuestions"], 0)
 
 
+class ExtractionPackageLazyExportTests(unittest.TestCase):
+    def test_bank_service_does_not_load_extractor(self):
+        code = (
+            "import sys, src.extraction.bank_service;"
+            "print('src.extraction.extractor' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True, check=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_package_exports_still_resolve(self):
+        import src.extraction as extraction
+        from src.extraction.exporter import DataExporter
+
+        self.assertIs(extraction.DataExporter, DataExporter)
+        with self.assertRaises(AttributeError):
+            extraction.missing_name
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,129 @@
+import queue
+import sys
+import unittest
+from unittest import mock
+
+from src.core import _browser_installer
+
+
+class BrowserChannelSelectionTests(unittest.TestCase):
+    def _select(self, config_channel, system_browsers):
+        settings = mock.Mock()
+        settings.get_browser_channel.return_value = config_channel
+        with mock.patch("src.core.config.get_settings_manager", return_value=settings), \
+                mock.patch.object(_browser_installer, "detect_system_browsers",
+                                  return_value=system_browsers) as detect:
+            result = _browser_installer.get_available_browser_channel()
+        return result, detect.call_count
+
+    def test_configured_channel_is_used_when_installed(self):
+        (channel, _), calls = self._select("msedge", {"chrome": "c", "msedge": "e"})
+
+        self.assertEqual(channel, "msedge")
+        self.assertEqual(calls, 1)
+
+    def test_unavailable_channel_falls_back_without_second_detection(self):
+        (channel, _), calls = self._select("chrome", {"msedge": "e"})
+
+        self.assertEqual(channel, "msedge")
+        self.assertEqual(calls, 1)
+
+    def test_no_system_browser_uses_bundled(self):
+        (channel, _), _calls = self._select("", {})
+
+        self.assertEqual(channel, "")
+
+
+
+class FakeInstallProcess:
+    """模拟 playwright install 子进程：stdout 逐行产出，kill 后管道关闭。"""
+
+    def __init__(self, lines, returncode=0, block=False):
+        self.args = ["playwright", "install", "chromium"]
+        self.pid = 12345
+        self.returncode = returncode
+        self._lines = queue.Queue()
+        for line in lines:
+            self._lines.put(line)
+        if not block:
+            self._lines.put(None)
+        self.stdout = self
+        self.killed = False
+
+    def __iter__(self):
+        while True:
+            line = self._lines.get()
+            if line is None:
+                return
+            yield line
+
+    def kill(self):
+        self.killed = True
+        self._lines.put(None)
+
+    def wait(self):
+        return self.returncode
+
+    def close(self):
+        pass
+
+
+class InstallPlaywrightBrowserTests(unittest.TestCase):
+    def _install(self, process):
+        with mock.patch.object(_browser_installer.subprocess, "Popen", return_value=process):
+            return _browser_installer.install_playwright_browser()
+
+    def test_successful_install(self):
+        ok, error = self._install(FakeInstallProcess(["Downloading Chromium\n", "done\n"]))
+
+        self.assertTrue(ok)
+        self.assertEqual(error, "")
+
+    def test_failed_install_reports_output_tail(self):
+        lines = [f"line {i}\n" for i in range(80)] + ["Error: download failed\n"]
+
+        ok, error = self._install(FakeInstallProcess(lines, returncode=1))
+
+        self.assertFalse(ok)
+        self.assertTrue(error.endswith("Error: download failed"))
+        self.assertNotIn("line 0\n", error)
+        self.assertEqual(len(error.splitlines()), _browser_installer._INSTALL_OUTPUT_TAIL_LINES)
+
+    def test_progress_lines_are_throttled(self):
+        lines = [f"|■■   | {pct}% of 150 MiB\n" for pct in range(0, 101)]
+
+        with self.assertLogs(_browser_installer.logger, level="INFO") as logs:
+            self._install(FakeInstallProcess(lines))
+
+        progress = [msg for msg in logs.output if "% of 150 MiB" in msg]
+        self.assertEqual(len(progress), 11)
+
+    def test_timeout_kills_process_tree(self):
+        process = FakeInstallProcess(["Downloading Chromium\n"], block=True)
+
+        with mock.patch.object(_browser_installer, "_INSTALL_TIMEOUT_SECONDS", 0.05), \
+                mock.patch.object(_browser_installer, "_kill_process_tree",
+                                  side_effect=lambda proc: proc.kill()) as kill_tree:
+            ok, error = self._install(process)
+
+        self.assertFalse(ok)
+        self.assertIn("超时", error)
+        kill_tree.assert_called_once_with(process)
+        self.assertTrue(process.killed)
+
+    def test_kill_process_tree_kills_descendants_first(self):
+        child = mock.Mock()
+        fake_psutil = mock.Mock(NoSuchProcess=ProcessLookupError, AccessDenied=PermissionError)
+        fake_psutil.Process.return_value.children.return_value = [child]
+        process = FakeInstallProcess([], block=True)
+
+        with mock.patch.dict(sys.modules, {"psutil": fake_psutil}):
+            _browser_installer._kill_process_tree(process)
+
+        fake_psutil.Process.assert_called_once_with(process.pid)
+        child.kill.assert_called_once_with()
+        self.assertTrue(process.killed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import os
+import unittest
+from unittest import mock
+
+from src.utils import console
+
+
+class ConfigureUtf8ConsoleTests(unittest.TestCase):
+    def test_windows_streams_are_switched_to_utf8(self):
+        stdout, stderr = mock.Mock(), None
+        with mock.patch.object(console.sys, "platform", "win32"), \
+                mock.patch.object(console.sys, "stdout", stdout), \
+                mock.patch.object(console.sys, "stderr", stderr), \
+                mock.patch.dict(os.environ, {}, clear=True):
+            console.configure_utf8_console()
+            self.assertEqual(os.environ["PYTHONUTF8"], "1")
+
+        stdout.reconfigure.assert_called_once_with(encoding="utf-8", errors="replace")
+
+    def test_other_platforms_are_left_untouched(self):
+        stdout = mock.Mock()
+        with mock.patch.object(console.sys, "platform", "linux"), \
+                mock.patch.object(console.sys, "stdout", stdout), \
+                mock.patch.dict(os.environ, {}, clear=True):
+            console.configure_utf8_console()
+            self.assertNotIn("PYTHONUTF8", os.environ)
+
+        stdout.reconfigure.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
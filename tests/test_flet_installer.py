@@ -0,0 +1,101 @@
+import importlib.metadata as importlib_metadata
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.core.flet_installer import FletInstaller
+
+
+class InstallFromRequirementsTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+        (self.tmp_dir / "requirements.txt").write_text("flet==0.82.2\n", encoding="utf-8")
+        self.hash_file = self.tmp_dir / "app-data" / FletInstaller.REQUIREMENTS_HASH_FILE
+
+        self.installer = FletInstaller()
+        patches = [
+            mock.patch.object(FletInstaller, "_requirements_hash_path", return_value=self.hash_file),
+            mock.patch.object(FletInstaller, "check_flet_installed", return_value=(True, "ok", "0.82.2")),
+            mock.patch.object(FletInstaller, "_requirements_satisfied", return_value=True),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _completed(self, returncode=0):
+        return subprocess.CompletedProcess(args=[], returncode=returncode, stdout="", stderr="boom")
+
+    def test_unchanged_requirements_skip_pip(self):
+        with mock.patch("src.core.flet_installer.subprocess.run", return_value=self._completed()) as run:
+            self.assertTrue(self.installer.install_from_requirements(str(self.tmp_dir))[0])
+            self.assertTrue(self.installer.install_from_requirements(str(self.tmp_dir))[0])
+
+        self.assertEqual(run.call_count, 1)
+        self.assertTrue(self.hash_file.exists())
+
+    def test_changed_requirements_rerun_pip(self):
+        with mock.patch("src.core.flet_installer.subprocess.run", return_value=self._completed()) as run:
+            self.installer.install_from_requirements(str(self.tmp_dir))
+            (self.tmp_dir / "requirements.txt").write_text("flet==0.82.2\nrequests\n", encoding="utf-8")
+            self.installer.install_from_requirements(str(self.tmp_dir))
+
+        self.assertEqual(run.call_count, 2)
+
+    def test_failed_install_does_not_record_hash(self):
+        with mock.patch("src.core.flet_installer.subprocess.run", return_value=self._completed(returncode=1)):
+            success, _ = self.installer.install_from_requirements(str(self.tmp_dir))
+
+        self.assertFalse(success)
+        self.assertFalse(self.hash_file.exists())
+
+    def test_unsatisfied_requirement_reruns_pip_despite_matching_hash(self):
+        with mock.patch("src.core.flet_installer.subprocess.run", return_value=self._completed()) as run:
+            self.installer.install_from_requirements(str(self.tmp_dir))
+            FletInstaller._requirements_satisfied.return_value = False
+            self.installer.install_from_requirements(str(self.tmp_dir))
+
+        self.assertEqual(run.call_count, 2)
+
+
+class RequirementsHashPathTests(unittest.TestCase):
+    def test_hash_marker_lives_next_to_user_config(self):
+        config_file = Path("/data/ZX-Answering-Assistant/cli_config.json")
+        with mock.patch("src.core.config.SettingsManager.default_config_file", return_value=config_file):
+            path = FletInstaller()._requirements_hash_path()
+
+        self.assertEqual(path, config_file.parent / FletInstaller.REQUIREMENTS_HASH_FILE)
+
+
+class RequirementsSatisfiedTests(unittest.TestCase):
+    VERSIONS = {"flet": "0.82.2", "requests": "2.32.0"}
+
+    def _satisfied(self, text):
+        def fake_version(name):
+            if name not in self.VERSIONS:
+                raise importlib_metadata.PackageNotFoundError(name)
+            return self.VERSIONS[name]
+
+        with mock.patch("src.core.flet_installer.importlib_metadata.version", side_effect=fake_version):
+            return FletInstaller._requirements_satisfied(text)
+
+    def test_all_installed_requirements_are_satisfied(self):
+        self.assertTrue(self._satisfied("# GUI\nflet==0.82.2\nrequests>=2.31.0  # core\n"))
+
+    def test_missing_package_is_not_satisfied(self):
+        self.assertFalse(self._satisfied("flet==0.82.2\nopenpyxl>=3.1.0\n"))
+
+    def test_wrong_version_is_not_satisfied(self):
+        self.assertFalse(self._satisfied("requests>=3.0\n"))
+
+    def test_pip_options_are_left_to_pip(self):
+        self.assertFalse(self._satisfied("--index-url https://example.invalid\nflet==0.82.2\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
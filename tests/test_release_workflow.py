@@ -20,6 +20,23 @@ class ReleaseWorkflowTests(unittest.TestCase):
         self.assertIsNotNone(tag_assignment)
         self.assertEqual(tag_assignment.group(1), "v${APP_VERSION}")
 
+    def test_build_runs_alongside_tests_but_release_waits_for_both(self):
+        build_needs = re.search(r"(?m)^  build:\n(?:    .+\n)*?    needs: \[([^\]]+)\]", self.workflow)
+        release_needs = re.search(r"(?m)^  release:\n(?:    .+\n)*?    needs:\n((?:      - .+\n)+)", self.workflow)
+
+        self.assertIsNotNone(build_needs)
+        self.assertNotIn("test", build_needs.group(1))
+        self.assertIsNotNone(release_needs)
+        self.assertIn("- test", release_needs.group(1))
+        self.assertIn("- build", release_needs.group(1))
+
+    def test_background_weban_download_is_reaped_on_any_exit(self):
+        step = self.workflow[self.workflow.index("- name: Install dependencies and download WeBan module"):]
+        trap = step.index("trap finish_weban EXIT")
+
+        self.assertLess(trap, step.index("download_weban > weban-download.log 2>&1 &"))
+        self.assertLess(trap, step.index("python -m pip install --upgrade pip"))
+
 
 if __name__ == "__main__":
     unittest.main()
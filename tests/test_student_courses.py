@@ -0,0 +1,60 @@
+import threading
+import unittest
+from unittest import mock
+
+from src.auth import _student_courses
+
+
+class FillUncompletedChaptersTests(unittest.TestCase):
+    def test_fills_every_course_and_skips_missing_ids(self):
+        courses = [
+            {"courseID": "c1", "courseName": "课程1"},
+            {"courseID": "c2", "courseName": "课程2"},
+            {"courseName": "无ID课程"},
+        ]
+        results = {"c1": [{"knowledge_id": "k1"}], "c2": None}
+
+        with mock.patch.object(_student_courses, "get_uncompleted_chapters",
+                               side_effect=lambda token, course_id, **kwargs: results[course_id]) as fetch:
+            returned = _student_courses.fill_uncompleted_chapters("token", courses, max_retries=1)
+
+        self.assertIs(returned, courses)
+        self.assertEqual(courses[0]["uncompleted_knowledges"], [{"knowledge_id": "k1"}])
+        self.assertEqual(courses[1]["uncompleted_knowledges"], [])
+        self.assertNotIn("uncompleted_knowledges", courses[2])
+        self.assertEqual(fetch.call_count, 2)
+        fetch.assert_any_call("token", "c1", delay_ms=0, max_retries=1)
+
+    def test_failed_course_does_not_block_others(self):
+        courses = [{"courseID": "bad"}, {"courseID": "good"}]
+
+        def fetch(token, course_id, **kwargs):
+            if course_id == "bad":
+                raise RuntimeError("boom")
+            return [{"knowledge_id": "k"}]
+
+        with mock.patch.object(_student_courses, "get_uncompleted_chapters", side_effect=fetch):
+            _student_courses.fill_uncompleted_chapters("token", courses)
+
+        self.assertEqual(courses[0]["uncompleted_knowledges"], [])
+        self.assertEqual(courses[1]["uncompleted_knowledges"], [{"knowledge_id": "k"}])
+
+    def test_requests_overlap(self):
+        courses = [{"courseID": "c1"}, {"courseID": "c2"}]
+        barrier = threading.Barrier(2, timeout=5)
+        passed = []
+
+        def fetch(token, course_id, **kwargs):
+            # 两个请求必须同时在途才能通过屏障，串行执行会超时
+            barrier.wait()
+            passed.append(course_id)
+            return []
+
+        with mock.patch.object(_student_courses, "get_uncompleted_chapters", side_effect=fetch):
+            _student_courses.fill_uncompleted_chapters("token", courses)
+
+        self.assertCountEqual(passed, ["c1", "c2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
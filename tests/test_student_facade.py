@@ -1,7 +1,7 @@
 """src.auth.student façade 拆分后的导入冒烟测试。
 
 验证 student.py 拆出 _student_courses/_student_browser_health 后，
-17 个公开符号仍可从 src.auth.student 导入（façade 兼容，零调用方改动）。
+18 个公开符号仍可从 src.auth.student 导入（façade 兼容，零调用方改动）。
 """
 
 import unittest
@@ -13,6 +13,7 @@ PUBLIC_SYMBOLS = [
     "get_student_access_token_with_credentials",
     "get_student_courses",
     "get_uncompleted_chapters",
+    "fill_uncompleted_chapters",
     "navigate_to_course",
     "close_browser",
     "get_course_progress_from_page",
@@ -0,0 +1,23 @@
+import unittest
+
+from src.utils.text import is_yes
+
+
+class IsYesTests(unittest.TestCase):
+    def test_affirmative_answers(self):
+        for answer in ("y", "YES", " 是 "):
+            with self.subTest(answer=answer):
+                self.assertTrue(is_yes(answer))
+
+    def test_other_answers_are_negative(self):
+        for answer in ("n", "no", "否", "yep"):
+            with self.subTest(answer=answer):
+                self.assertFalse(is_yes(answer, default=True))
+
+    def test_empty_answer_uses_default(self):
+        self.assertTrue(is_yes("", default=True))
+        self.assertFalse(is_yes("   "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+from unittest import mock
+
+from src.ui import theme
+from src.ui.theme import Fonts
+
+
+class SystemFontTests(unittest.TestCase):
+    def setUp(self):
+        Fonts.get_system_font.cache_clear()
+        self.addCleanup(Fonts.get_system_font.cache_clear)
+
+    def test_font_matches_platform_and_is_memoized(self):
+        for system in ("Windows", "Darwin"):
+            with self.subTest(system=system):
+                Fonts.get_system_font.cache_clear()
+                with mock.patch.object(theme.platform, "system", return_value=system) as probe:
+                    self.assertEqual(Fonts.get_system_font(), theme._SYSTEM_FONTS[system])
+                    self.assertEqual(Fonts.get_system_font(), theme._SYSTEM_FONTS[system])
+
+                probe.assert_called_once_with()
+
+    def test_unknown_platform_falls_back_to_linux_font(self):
+        with mock.patch.object(theme.platform, "system", return_value="FreeBSD"):
+            self.assertEqual(Fonts.get_system_font(), Fonts.LINUX)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import base64
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from src.auth import _student_browser_ops, teacher, token_manager
+from src.auth.token_manager import TokenManager
+from src.core.config import SettingsManager
+
+
+def _jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+class BrowserTokenCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.token_manager = TokenManager()
+        patcher = mock.patch.object(_student_browser_ops, "get_token_manager",
+                                    return_value=self.token_manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_extracted_token_is_cached_for_later_calls(self):
+        with mock.patch.object(_student_browser_ops, "run_in_thread_if_asyncio",
+                               return_value="browser-token") as extract:
+            self.assertEqual(_student_browser_ops.get_access_token_from_browser(), "browser-token")
+            self.assertEqual(_student_browser_ops.get_access_token_from_browser(), "browser-token")
+
+        self.assertEqual(extract.call_count, 1)
+
+    def test_failed_extraction_is_not_cached(self):
+        with mock.patch.object(_student_browser_ops, "run_in_thread_if_asyncio",
+                               return_value=None) as extract:
+            self.assertIsNone(_student_browser_ops.get_access_token_from_browser())
+            self.assertIsNone(_student_browser_ops.get_access_token_from_browser())
+
+        self.assertEqual(extract.call_count, 2)
+
+    def _cached_seconds(self, token):
+        with mock.patch.object(_student_browser_ops, "run_in_thread_if_asyncio", return_value=token), \
+                mock.patch.object(self.token_manager, "set_student_token") as set_token:
+            _student_browser_ops.get_access_token_from_browser()
+        if not set_token.called:
+            return None
+        return set_token.call_args.kwargs["expiry_seconds"]
+
+    def test_jwt_token_is_cached_until_its_own_expiry(self):
+        seconds = self._cached_seconds(_jwt(time.time() + 3600))
+
+        self.assertGreater(seconds, 3400)
+        self.assertLess(seconds, 3600)
+
+    def test_nearly_expired_jwt_token_is_not_cached(self):
+        self.assertIsNone(self._cached_seconds(_jwt(time.time() + 30)))
+
+    def test_token_without_expiry_is_cached_briefly(self):
+        self.assertEqual(self._cached_seconds("opaque-token"),
+                         _student_browser_ops._UNKNOWN_EXPIRY_CACHE_SECONDS)
+
+
+class TeacherTokenCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.token_manager = TokenManager()
+        for target in (teacher, token_manager):
+            patcher = mock.patch.object(target, "get_token_manager",
+                                        return_value=self.token_manager)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_login_token_is_cached_for_later_calls(self):
+        with mock.patch.object(teacher, "run_in_thread_if_asyncio",
+                               return_value="teacher-token") as login:
+            self.assertEqual(teacher.get_access_token(), "teacher-token")
+            self.assertEqual(teacher.get_access_token(), "teacher-token")
+
+        self.assertEqual(login.call_count, 1)
+
+    def test_failed_login_is_not_cached(self):
+        with mock.patch.object(teacher, "run_in_thread_if_asyncio",
+                               return_value=None) as login:
+            self.assertIsNone(teacher.get_access_token())
+            self.assertIsNone(teacher.get_access_token())
+
+        self.assertEqual(login.call_count, 2)
+
+    def test_clear_access_token_forces_new_login(self):
+        self.token_manager.set_teacher_token("stale-token")
+        teacher.clear_access_token()
+
+        with mock.patch.object(teacher, "run_in_thread_if_asyncio",
+                               return_value="fresh-token") as login:
+            self.assertEqual(teacher.get_access_token(), "fresh-token")
+
+        self.assertEqual(login.call_count, 1)
+
+    def test_changing_teacher_credentials_invalidates_cached_token(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            settings = SettingsManager(os.path.join(tmp_dir, "cli_config.json"))
+
+            self.token_manager.set_teacher_token("old-account-token")
+            settings.set_teacher_credentials("new-user", "new-pass")
+            self.assertIsNone(self.token_manager.get_teacher_token())
+
+            self.token_manager.set_teacher_token("new-account-token")
+            settings.clear_teacher_credentials()
+            self.assertIsNone(self.token_manager.get_teacher_token())
+
+
+if __name__ == "__main__":
+    unittest.main()
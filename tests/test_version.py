@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import version
+
+
+class VersionInfoTests(unittest.TestCase):
+    def test_version_info_tuples_follow_version_string(self):
+        major, minor, patch = (int(part) for part in version.VERSION.split(".")[:3])
+
+        self.assertEqual(version.VERSION_INFO["file_version"], (major, minor, patch, 0))
+        self.assertEqual(version.VERSION_INFO["product_version"], (major, minor, patch, 0))
+
+    def test_version_tuple_falls_back_for_unparseable_version(self):
+        self.assertEqual(version._version_tuple("dev"), (0, 0, 0, 0))
+
+    def test_create_version_file_writes_build_info(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = version.create_version_file(str(Path(tmp) / "nested" / "VERSION.txt"))
+            content = path.read_text(encoding="utf-8")
+
+        self.assertTrue(content.startswith(version.VERSION_NAME + "\n"))
+        self.assertIn(f"版本号: {version.VERSION}", content)
+        self.assertIn(f"构建模式: {version.BUILD_MODE}", content)
+
+    def test_git_commit_lookup_runs_once(self):
+        version._get_git_commit.cache_clear()
+        with mock.patch("version.subprocess.run") as run:
+            run.return_value.returncode = 0
+            run.return_value.stdout = b"abc1234\n"
+
+            self.assertEqual(version.get_build_info()["git_commit"], "abc1234")
+            self.assertEqual(version.get_build_info()["git_commit"], "abc1234")
+
+        self.assertEqual(run.call_count, 1)
+        version._get_git_commit.cache_clear()
+
+    def test_print_version_info_writes_once(self):
+        with mock.patch("builtins.print") as fake_print:
+            version.print_version_info()
+
+        fake_print.assert_called_once()
+        banner = fake_print.call_args.args[0]
+        self.assertIn(version.get_full_version_string(), banner)
+        self.assertIn(f"版本号: {version.VERSION}", banner)
+
+
+class WebanVersionLazyTests(unittest.TestCase):
+    def setUp(self):
+        # 其它测试或导入可能已经访问过 WEBAN_VERSION，先移除缓存值，tearDown 时还原
+        self._missing = object()
+        self._saved = vars(version).pop("WEBAN_VERSION", self._missing)
+
+    def tearDown(self):
+        vars(version).pop("WEBAN_VERSION", None)
+        if self._saved is not self._missing:
+            version.WEBAN_VERSION = self._saved
+
+    def test_weban_version_is_resolved_lazily(self):
+        with mock.patch("version._get_weban_version", return_value="9.9.9") as lookup:
+            self.assertNotIn("WEBAN_VERSION", vars(version))
+            lookup.assert_not_called()
+
+            self.assertEqual(version.WEBAN_VERSION, "9.9.9")
+            self.assertEqual(version.WEBAN_VERSION, "9.9.9")
+
+        lookup.assert_called_once_with()
+        self.assertEqual(vars(version)["WEBAN_VERSION"], "9.9.9")
+
+
+if __name__ == "__main__":
+    unittest.main()
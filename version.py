@@ -3,62 +3,17 @@
 用于记录程序的版本号、构建信息等
 """
 
+import functools
+import re
 import subprocess
 import sys
-import os
 from datetime import datetime
 from pathlib import Path
 
-# 设置控制台编码为 UTF-8（修复 Windows GBK 编码问题）
-if sys.platform == 'win32':
-    try:
-        import codecs
-        # 检查 stdout 是否已经被重新定向，避免重复 detach
-        if hasattr(sys.stdout, 'buffer') and not isinstance(sys.stdout, codecs.Codec):
-            sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer)
-            sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer)
-    except:
-        # 如果设置失败，尝试通过环境变量
-        os.environ['PYTHONIOENCODING'] = 'utf-8'
-
 # 版本名称
 VERSION_NAME = "ZX Answering Assistant"
 
-def _get_version_from_git() -> str:
-    """从 Git 标签读取版本号
-
-    Returns:
-        版本号字符串，如 '3.2.0'，如果失败返回 None
-    """
-    try:
-        result = subprocess.run(
-            ["git", "describe", "--tags", "--abbrev=0"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            # 移除前缀 'v'
-            if version.startswith('v'):
-                version = version[1:]
-            return version
-    except Exception:
-        pass
-    return None
-
-def _get_version() -> str:
-    """获取版本号（优先级：Git > 默认值）"""
-    # 尝试从 Git 读取
-    version = _get_version_from_git()
-    if version:
-        return version
-
-    # 如果失败，使用默认值
-    return "4.0.1"
-
-# VERSION = _get_version()
-
+# 版本号为唯一来源：CI 的 release.yml 直接用正则读取这一行，不再依赖 Git 标签
 VERSION = "4.0.1"
 
 
@@ -75,28 +30,51 @@ def _get_weban_version() -> str:
         return "Unavailable"
 
 
-WEBAN_VERSION = _get_weban_version()
-
-# 构建信息（会在打包时自动更新，开发时自动获取）
-def _get_build_info():
-    """获取构建信息"""
-    now = datetime.now()
-    build_date = now.strftime("%Y-%m-%d")
-    build_time = now.strftime("%H:%M:%S")
-
-    # 获取Git提交信息
+@functools.lru_cache(maxsize=1)
+def _get_git_commit() -> str:
+    """获取当前 Git 提交短哈希（进程内只执行一次 git）"""
     git_commit = ""
     try:
+        # 输出只有几个 ASCII 字符，直接读字节再解码，无需文本模式包装
         result = subprocess.run(
             ["git", "rev-parse", "--short", "HEAD"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5
         )
         if result.returncode == 0:
-            git_commit = result.stdout.strip()
-    except:
+            git_commit = result.stdout.decode("ascii", "replace").strip()
+    except (OSError, subprocess.SubprocessError):
+        # 未安装 git（FileNotFoundError）或超时
         pass
+    return git_commit
+
+
+# 延迟计算的模块属性：首次访问时才调用对应函数（按名称查找），结果缓存到模块全局变量
+_LAZY_ATTRS = {
+    # WeBan 子模块导入较重（nodriver 等依赖）
+    "WEBAN_VERSION": "_get_weban_version",
+    # 需要启动 git 子进程
+    "GIT_COMMIT": "_get_git_commit",
+}
+
+
+def __getattr__(name):
+    """按需计算 WEBAN_VERSION / GIT_COMMIT，避免 import version 时产生额外开销。"""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = globals()[_LAZY_ATTRS[name]]()
+    globals()[name] = value
+    return value
+
+
+# 构建信息（会在打包时自动更新，开发时自动获取）
+def _get_build_info():
+    """获取构建信息"""
+    now = datetime.now()
+    build_date = now.strftime("%Y-%m-%d")
+    build_time = now.strftime("%H:%M:%S")
 
     # 判断构建模式
     build_mode = "development"
@@ -107,9 +85,9 @@ def _get_build_info():
     elif 'dist' in str(Path(__file__).parent):
         build_mode = "release"
 
-    return build_date, build_time, git_commit, build_mode
+    return build_date, build_time, build_mode
 
-BUILD_DATE, BUILD_TIME, GIT_COMMIT, BUILD_MODE = _get_build_info()
+BUILD_DATE, BUILD_TIME, BUILD_MODE = _get_build_info()
 
 
 def get_version_string():
@@ -132,23 +110,37 @@ def get_build_info():
         "name": VERSION_NAME,
         "build_date": BUILD_DATE,
         "build_time": BUILD_TIME,
-        "git_commit": GIT_COMMIT,
+        "git_commit": _get_git_commit(),
         "build_mode": BUILD_MODE
     }
 
 
 def print_version_info():
-    """打印版本信息"""
-    print("\n" + "=" * 60)
-    print(f"📦 {get_full_version_string()}")
-    print("=" * 60)
+    """打印版本信息（拼成一个字符串一次写出，避免逐行写终端）"""
+    separator = "=" * 60
     info = get_build_info()
-    print(f"版本号: {info['version']}")
-    print(f"构建日期: {info['build_date']}")
-    print(f"构建时间: {info['build_time']}")
-    print(f"Git提交: {info['git_commit']}")
-    print(f"构建模式: {info['build_mode']}")
-    print("=" * 60 + "\n")
+    print(
+        f"\n{separator}\n"
+        f"📦 {get_full_version_string()}\n"
+        f"{separator}\n"
+        f"版本号: {info['version']}\n"
+        f"构建日期: {info['build_date']}\n"
+        f"构建时间: {info['build_time']}\n"
+        f"Git提交: {info['git_commit']}\n"
+        f"构建模式: {info['build_mode']}\n"
+        f"{separator}\n",
+        flush=True,
+    )
+
+
+# 版本信息文件模板（create_version_file 使用）
+_VERSION_FILE_TEMPLATE = """{name}
+版本号: {version}
+构建日期: {build_date}
+构建时间: {build_time}
+Git提交: {git_commit}
+构建模式: {build_mode}
+"""
 
 
 def create_version_file(file_path: str) -> Path:
@@ -163,13 +155,7 @@ def create_version_file(file_path: str) -> Path:
     version_file = Path(file_path)
     version_file.parent.mkdir(parents=True, exist_ok=True)
 
-    content = f"""{VERSION_NAME}
-版本号: {VERSION}
-构建日期: {BUILD_DATE}
-构建时间: {BUILD_TIME}
-Git提交: {GIT_COMMIT}
-构建模式: {BUILD_MODE}
-"""
+    content = _VERSION_FILE_TEMPLATE.format(**get_build_info())
 
     with open(version_file, 'w', encoding='utf-8') as f:
         f.write(content)
@@ -177,10 +163,23 @@ Git提交: {GIT_COMMIT}
     return version_file
 
 
-# 版本信息字典（用于 Windows 版本资源）
+_VERSION_NUMBER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)")
+
+
+def _version_tuple(version: str) -> tuple:
+    """将 '4.0.1' 转换为 Windows 版本资源使用的四段元组 (4, 0, 1, 0)"""
+    match = _VERSION_NUMBER_RE.match(version)
+    if not match:
+        return (0, 0, 0, 0)
+    return tuple(int(part) for part in match.groups()) + (0,)
+
+
+_VERSION_TUPLE = _version_tuple(VERSION)
+
+# 版本信息字典（用于 Windows 版本资源，版本号从 VERSION 派生，避免两处不同步）
 VERSION_INFO = {
-    'file_version': (4, 0, 1, 0),
-    'product_version': (4, 0, 1, 0),
+    'file_version': _VERSION_TUPLE,
+    'product_version': _VERSION_TUPLE,
     'file_description': '智能答题助手 - 自动化答题系统',
     'copyright': 'Copyright (C) 2024-2026',
     'company_name': 'ZX Project',